@@ -1,18 +1,48 @@
-import json
-import requests
+import argparse
+import math
 import sys
 import threading
-import time
+from collections import deque
+from dataclasses import dataclass, field
 from datetime import datetime
+from itertools import islice
 from typing import Dict, List, Tuple
 
-# Enhanced UI and styling libraries
+# Enhanced UI and styling libraries; the heavier Rich renderables (and the
+# asyncio/HTTP stack) are imported where they are used so one-shot
+# conversions skip them
 from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich.text import Text
-from rich.layout import Layout
-from rich.live import Live
+
+@dataclass(slots=True)
+class Currency:
+    code: str
+    rate: float
+    symbol: str = ''
+    full_name: str = ''
+    amount: float = 0.0
+    rate_str: str = field(default='', init=False, repr=False)
+
+    def __post_init__(self):
+        self.rate_str = format(self.rate, '.4f')
+
+    def set_rate(self, rate):
+        """Update the rate and its cached display string."""
+        if rate != self.rate:
+            self.rate = rate
+            self.rate_str = format(rate, '.4f')
+
+class RateSnapshot:
+    """Read-only set of rates; replaced as a whole whenever rates change."""
+    __slots__ = ('index', 'rates', 'cross', 'ts', 'stale')
+
+    def __init__(self, index, rates, ts=None, stale=frozenset()):
+        self.index = index  # {code: position in rates}
+        # Tuples so writers must publish a new snapshot rather than patch this one
+        self.rates = tuple(rates)
+        # cross[i][j] converts one unit of currency i into currency j
+        self.cross = tuple(tuple(to / base for to in self.rates) for base in self.rates)
+        self.ts = ts
+        self.stale = stale  # codes the last update had no fresh rate for
 
 class CurrencyConverter:
     # Comprehensive dictionary of world currencies
@@ -37,20 +67,62 @@ class CurrencyConverter:
         'ZAR': {'name': 'South African Rand', 'symbol': 'R', 'rate': 18.50}
     }
 
-    def __init__(self):
+    # Independent free exchange rate APIs polled concurrently; each currency
+    # takes its rate from the fastest provider that quotes it
+    RATE_PROVIDERS = (
+        'https://open.exchangerate-api.com/v6/latest',
+        'https://cdn.jsdelivr.net/npm/@fawazahmed0/currency-api@latest/v1/currencies/usd.json',
+    )
+
+    # Maximum number of conversions kept in history
+    HISTORY_SIZE = 1000
+
+    def __init__(self, background_updates=True):
         self.console = Console()
         self.currencies = {}
-        self.conversion_history = []
-        self.rates_last_updated = None
-        self.update_lock = threading.Lock()
-        self.stop_update_thread = threading.Event()
+        self._snap = RateSnapshot({}, ())
+        self.conversion_history = deque(maxlen=self.HISTORY_SIZE)
+        
+        # Event loop and task owned by the rate updater thread
+        self._update_loop = None
+        self._update_task = None
+        self._stopping = False
+        self._stop_display = threading.Event()
+        self._live_table = None
+        self._caption_updated = None
         
         # Preload world currencies
         self._load_default_currencies()
         
-        # Start live rate update thread
-        self.rate_update_thread = threading.Thread(target=self._live_rate_updater, daemon=True)
-        self.rate_update_thread.start()
+        # Start live rate update thread (skipped for one-shot conversions)
+        self.rate_update_thread = None
+        if background_updates:
+            self.rate_update_thread = threading.Thread(target=self._run_rate_updater, daemon=True)
+            self.rate_update_thread.start()
+        
+        # The menu never changes, so build it once (the panel on first display)
+        options = [
+            "Convert Currency",
+            "View Live Currencies",
+            "View Conversion History",
+            "Exit"
+        ]
+        self._menu_panel = None
+        self._menu_lines = "\n".join(
+            f"[bold blue]{i}. {option}[/bold blue]" for i, option in enumerate(options, 1)
+        )
+        self._menu_actions = {
+            1: self._convert_interactive,
+            2: self.display_currencies,
+            3: self._show_history,
+            4: self._quit
+        }
+        self._menu_running = False
+
+    @property
+    def rates_last_updated(self):
+        """Time of the last successful rate update, or None."""
+        return self._snap.ts
 
     def _load_default_currencies(self):
         """Load default world currencies."""
@@ -62,42 +134,178 @@ class CurrencyConverter:
                 details['name']
             )
 
-    def _live_rate_updater(self):
+    def _run_rate_updater(self):
+        """Run the asynchronous rate updater on this thread's own event loop."""
+        import asyncio
+        
+        try:
+            asyncio.run(self._live_rate_updater())
+        except asyncio.CancelledError:
+            # Cancelled by stop_updates(); the session has already been closed
+            pass
+
+    async def _live_rate_updater(self):
         """Continuously update exchange rates in the background."""
-        while not self.stop_update_thread.is_set():
-            try:
-                # Using a free exchange rate API
-                response = requests.get('https://open.exchangerate-api.com/v6/latest')
-                if response.status_code == 200:
-                    rates = response.json().get('rates', {})
+        import asyncio
+        
+        try:
+            import aiohttp
+        except ImportError as e:
+            # Without an HTTP client the default rates stay in use
+            print(f"Rate update error: {e}; live rates are disabled")
+            return
+        
+        self._update_loop = asyncio.get_running_loop()
+        self._update_task = asyncio.current_task()
+        if self._stopping:
+            return
+        
+        timeout = aiohttp.ClientTimeout(total=10, connect=3.05)
+        async with aiohttp.ClientSession(timeout=timeout, headers={'Accept': 'application/json'}) as session:
+            while True:
+                try:
+                    rates = await self._fetch_merged_rates(session)
+                    self._apply_rates(rates)
                     
-                    # Thread-safe update of rates
-                    with self.update_lock:
-                        for code, rate in rates.items():
-                            if code in self.currencies:
-                                self.currencies[code].rate = rate
-                        
-                        self.rates_last_updated = datetime.now()
+                    # Wait for 15 minutes before next update
+                    delay = 900  # 15 * 60 seconds
                 
-                # Wait for 15 minutes before next update
-                time.sleep(900)  # 15 * 60 seconds
-            
-            except Exception as e:
-                # Log error (or you could add more sophisticated error handling)
-                print(f"Rate update error: {e}")
-                # Wait 5 minutes before retrying if update fails
-                time.sleep(300)
+                except Exception as e:
+                    # Log error (or you could add more sophisticated error handling)
+                    print(f"Rate update error: {e}")
+                    # Wait 5 minutes before retrying if update fails
+                    delay = 300
+                
+                # stop_updates() cancels this task, interrupting the sleep or
+                # any fetch still in flight
+                await asyncio.sleep(delay)
+
+    async def _fetch_merged_rates(self, session):
+        """Return rates merged per currency from all providers, fastest first."""
+        import asyncio
+        
+        pending = {
+            asyncio.create_task(self._fetch_rates(session, url))
+            for url in self.RATE_PROVIDERS
+        }
+        merged = {}
+        error = None
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                # Check every finished task so no failure goes unretrieved
+                for task in done:
+                    if task.exception() is not None:
+                        error = task.exception()
+                        continue
+                    for code, rate in task.result().items():
+                        merged.setdefault(code, rate)
+                
+                # Stop waiting once every known currency has a fresh rate
+                if self.currencies.keys() <= merged.keys():
+                    break
+        finally:
+            for task in pending:
+                task.cancel()
+        
+        if not merged:
+            raise error or RuntimeError("No rate providers configured")
+        return merged
+
+    async def _fetch_rates(self, session, url):
+        """Fetch rates from a single provider, normalised to USD."""
+        # Prefer the faster orjson parser when it is installed
+        try:
+            import orjson as json_lib
+        except ImportError:
+            import json as json_lib
+        
+        async with session.get(url) as response:
+            response.raise_for_status()
+            data = json_lib.loads(await response.read())
+        
+        if 'rates' in data:
+            rates = dict(data['rates'] or {})
+            base = data.get('base_code') or data.get('base') or 'USD'
+        else:
+            # currency-api layout: {"date": ..., "usd": {"eur": 0.93, ...}}
+            rates = {code.upper(): rate for code, rate in (data.get('usd') or {}).items()}
+            base = 'USD'
+        
+        # Drop anything that is not a usable rate; zero or NaN would poison the cross matrix
+        rates = {
+            code: float(rate) for code, rate in rates.items()
+            if isinstance(rate, (int, float)) and not isinstance(rate, bool)
+            and math.isfinite(rate) and rate > 0
+        }
+        if not rates:
+            raise ValueError(f"No rates returned by {url}")
+        
+        # Providers omit their own base currency or may quote against another one
+        rates[base] = 1.0
+        usd_rate = rates.get('USD')
+        if not usd_rate:
+            raise ValueError(f"No USD rate returned by {url}")
+        if usd_rate != 1.0:
+            rates = {code: rate / usd_rate for code, rate in rates.items()}
+        
+        return rates
+
+    def _apply_rates(self, rates):
+        """Apply fetched rates to the known currencies."""
+        # Copy the current snapshot, update it and publish it with a single store
+        snap = self._snap
+        new_rates = list(snap.rates)
+        stale = set(snap.index)
+        for code, rate in rates.items():
+            code = sys.intern(code)
+            i = snap.index.get(code)
+            if i is not None:
+                new_rates[i] = rate
+                stale.discard(code)
+        
+        # Update the displayed rates first so a fresh timestamp never
+        # appears next to old rates in the live table
+        for code, rate in zip(snap.index, new_rates):
+            self.currencies[code].set_rate(rate)
+        self._snap = RateSnapshot(snap.index, new_rates, datetime.now(), frozenset(stale))
+
+    def stop_updates(self, timeout=2):
+        """Stop the background rate updater and wait briefly for it to exit."""
+        self._stopping = True
+        loop, task = self._update_loop, self._update_task
+        if loop is not None and task is not None:
+            try:
+                loop.call_soon_threadsafe(task.cancel)
+            except RuntimeError:
+                # Event loop already closed
+                pass
+        
+        if self.rate_update_thread is not None:
+            self.rate_update_thread.join(timeout=timeout)
 
     def add_currency(self, code, rate, symbol='', full_name=''):
         """Add or update a currency."""
-        class Currency:
-            def __init__(self, code, rate, symbol='', full_name=''):
-                self.code = code
-                self.rate = rate
-                self.symbol = symbol
-                self.full_name = full_name
-                self.amount = 0.0
+        # A zero, negative or non-finite rate would poison every cross rate
+        if not (isinstance(rate, (int, float)) and math.isfinite(rate) and rate > 0):
+            raise ValueError(f"Invalid rate for {code}: {rate!r}")
+        
+        # Interned keys let dict lookups short-circuit on identity
+        code = sys.intern(code)
+        symbol = sys.intern(symbol)
+        
+        snap = self._snap
+        if code in snap.index:
+            index = snap.index
+            new_rates = list(snap.rates)
+            new_rates[index[code]] = rate
+            # Name and symbol cells are only written on rebuild
+            self._live_table = None
+        else:
+            index = {**snap.index, code: len(snap.index)}
+            new_rates = snap.rates + (rate,)
         
+        self._snap = RateSnapshot(index, new_rates, snap.ts, snap.stale)
         self.currencies[code] = Currency(code, rate, symbol, full_name)
 
     def convert(self, from_currency, to_currency, amount):
@@ -107,18 +315,14 @@ class CurrencyConverter:
             if from_currency not in self.currencies or to_currency not in self.currencies:
                 raise ValueError("One or both currencies not found")
             
-            # Perform conversion with thread-safe rate access
-            with self.update_lock:
-                converted = (amount / self.currencies[from_currency].rate) * self.currencies[to_currency].rate
+            # Grab the current snapshot once; no lock needed
+            snap = self._snap
+            converted = snap.cross[snap.index[from_currency]][snap.index[to_currency]] * amount
             
-            # Record conversion history
-            self.conversion_history.append({
-                'from': from_currency,
-                'to': to_currency,
-                'amount': amount,
-                'converted': converted,
-                'date': datetime.now()
-            })
+            # Record conversion history as (from, to, amount, formatted converted, date)
+            self.conversion_history.append(
+                (from_currency, to_currency, amount, f"{converted:,.2f}", datetime.now())
+            )
             
             return converted
         
@@ -126,88 +330,145 @@ class CurrencyConverter:
             self.console.print(f"[red]Conversion Error: {e}[/red]")
             return None
 
-    def display_currencies(self):
-        """Display all available currencies with live updates."""
-        def generate_currency_table():
-            table = Table(title="Available Currencies")
-            table.add_column("Code", style="cyan")
-            table.add_column("Name", style="magenta")
-            table.add_column("Symbol", style="green")
-            table.add_column("Current Rate", style="yellow")
-            table.add_column("Last Updated", style="dim")
+    def _build_table(self):
+        """Return the live currencies table, refreshing only cells that changed."""
+        from rich.table import Table
+        
+        # Rebuild from scratch on first use or if currencies were added
+        if self._live_table is None or self._live_table.row_count != len(self.currencies):
+            # Fixed column widths let Rich skip measuring every cell
+            table = Table(title="Available Currencies", expand=False, pad_edge=False)
+            table.add_column("Code", style="cyan", width=4, no_wrap=True)
+            table.add_column("Name", style="magenta", width=28, no_wrap=True)
+            table.add_column("Symbol", style="green", width=6, no_wrap=True)
+            table.add_column("Current Rate", style="yellow", width=14, no_wrap=True)
+
+            for code, currency in self.currencies.items():
+                table.add_row(
+                    code, 
+                    currency.full_name, 
+                    currency.symbol, 
+                    currency.rate_str
+                )
+
+            self._live_table = table
+            self._caption_updated = None
+        else:
+            # Mutate the cached cells in place instead of allocating a new table
+            rate_cells = self._live_table.columns[3]._cells
+            for i, currency in enumerate(self.currencies.values()):
+                if rate_cells[i] is not currency.rate_str:
+                    rate_cells[i] = currency.rate_str
+
+        # Format the timestamp only when the rates have been refreshed
+        snap = self._snap
+        if self._live_table.caption is None or self._caption_updated != snap.ts:
+            self._caption_updated = snap.ts
+            caption = (
+                f"Last updated: {snap.ts.strftime('%Y-%m-%d %H:%M:%S')}"
+                if snap.ts else "Last updated: Not updated"
+            )
+            if snap.stale:
+                caption += f" (not refreshed: {', '.join(sorted(snap.stale))})"
+            self._live_table.caption = caption
+
+        return self._live_table
+
+    def convert_batch(self, from_currency, amount, to_currencies=None):
+        """Convert an amount into several currencies at once."""
+        try:
+            targets = list(to_currencies) if to_currencies is not None else None
+            if from_currency not in self.currencies or (
+                targets is not None and any(code not in self.currencies for code in targets)
+            ):
+                raise ValueError("One or more currencies not found")
             
-            with self.update_lock:
-                for code, currency in self.currencies.items():
-                    table.add_row(
-                        code, 
-                        currency.full_name, 
-                        currency.symbol, 
-                        f"{currency.rate:.4f}",
-                        self.rates_last_updated.strftime("%Y-%m-%d %H:%M:%S") if self.rates_last_updated else "Not updated"
-                    )
+            # Scale the source currency's cross-rate row
+            snap = self._snap
+            row = snap.cross[snap.index[from_currency]]
             
-            return table
+            if targets is None:
+                return {code: rate * amount for code, rate in zip(snap.index, row)}
+            return {code: row[snap.index[code]] * amount for code in targets}
+        
+        except Exception as e:
+            self.console.print(f"[red]Conversion Error: {e}[/red]")
+            return None
 
-        # Use Live display for real-time updates
-        with Live(generate_currency_table(), console=self.console, refresh_per_second=0.5) as live:
-            while True:
-                time.sleep(5)  # Update every 5 seconds
-                live.update(generate_currency_table())
+    def display_currencies(self):
+        """Display all available currencies with live updates."""
+        from rich.live import Live
+        
+        self._stop_display.clear()
+        self.console.print("[dim]Press Ctrl+C to return to the menu.[/dim]")
 
-                # Add a way to exit (optional)
-                if not live.is_alive:
-                    break
+        # Rich's own refresh thread repaints from the cached table
+        with Live(
+            self._build_table(),
+            console=self.console,
+            refresh_per_second=2,
+            auto_refresh=True,
+            screen=False,
+            get_renderable=self._build_table
+        ):
+            try:
+                # Timed waits so Ctrl+C is delivered on Windows too
+                while not self._stop_display.wait(0.5):
+                    pass
+            except KeyboardInterrupt:
+                # Leave the live view without exiting the application
+                self._stop_display.set()
 
     def interactive_menu(self):
         """Main interactive menu."""
-        while True:
-            self.console.print(Panel(
+        if self._menu_panel is None:
+            from rich.panel import Panel
+            from rich.text import Text
+            
+            self._menu_panel = Panel(
                 Text("💱 Live Currency Converter 💱", style="bold blue"),
                 border_style="blue"
-            ))
-            
-            options = [
-                "Convert Currency",
-                "View Live Currencies",
-                "View Conversion History",
-                "Exit"
-            ]
-            
-            for i, option in enumerate(options, 1):
-                self.console.print(f"[bold blue]{i}. {option}[/bold blue]")
+            )
+        
+        self._menu_running = True
+        while self._menu_running:
+            self.console.print(self._menu_panel)
+            self.console.print(self._menu_lines)
             
             try:
                 choice = input("Choose an option (1-4): ")
                 choice = int(choice)
                 
-                if choice == 1:
-                    self._convert_interactive()
-                elif choice == 2:
-                    self.display_currencies()
-                elif choice == 3:
-                    self._show_history()
-                elif choice == 4:
-                    # Stop the rate update thread before exiting
-                    self.stop_update_thread.set()
-                    break
+                action = self._menu_actions.get(choice)
+                if action is not None:
+                    action()
                 else:
                     self.console.print("[red]Invalid option. Try again.[/red]")
             
             except ValueError:
                 self.console.print("[red]Please enter a valid number.[/red]")
             
-            input("\nPress Enter to continue...")
+            if self._menu_running:
+                input("\nPress Enter to continue...")
+
+    def _quit(self):
+        """Leave the interactive menu."""
+        # Stop the rate updater before exiting
+        self.stop_updates()
+        self._menu_running = False
 
     def _convert_interactive(self):
         """Interactive currency conversion."""
+        from rich.panel import Panel
+        
         # Briefly show available currencies
         self.console.print("\n[yellow]Available Currencies:[/yellow]")
         for code in self.currencies.keys():
             self.console.print(code, end=" ")
         print("\n")
         
-        from_currency = input("Enter source currency code: ").upper()
-        to_currency = input("Enter target currency code: ").upper()
+        from_currency = sys.intern(input("Enter source currency code: ").upper())
+        to_currency = sys.intern(input("Enter target currency code: ").upper())
         
         try:
             amount = float(input("Enter amount to convert: "))
@@ -229,6 +490,8 @@ class CurrencyConverter:
 
     def _show_history(self):
         """Display conversion history."""
+        from rich.table import Table
+        
         if not self.conversion_history:
             self.console.print("[yellow]No conversion history available.[/yellow]")
             return
@@ -240,19 +503,52 @@ class CurrencyConverter:
         table.add_column("Converted", style="yellow")
         table.add_column("Date", style="dim")
         
-        for entry in reversed(self.conversion_history[-10:]):  # Last 10 entries
+        for from_currency, to_currency, amount, converted, date in islice(reversed(self.conversion_history), 10):  # Last 10 entries
             table.add_row(
-                entry['from'], 
-                entry['to'], 
-                f"{entry['amount']:,.2f}", 
-                f"{entry['converted']:,.2f}", 
-                entry['date'].strftime("%Y-%m-%d %H:%M")
+                from_currency, 
+                to_currency, 
+                f"{amount:,.2f}", 
+                converted, 
+                date.strftime("%Y-%m-%d %H:%M")
             )
         
         self.console.print(table)
 
 def main():
+    parser = argparse.ArgumentParser(description="Live Currency Converter")
+    parser.add_argument(
+        '--convert',
+        nargs=3,
+        metavar=('FROM', 'TO', 'AMOUNT'),
+        help="Convert AMOUNT from FROM to TO and exit"
+    )
+    args = parser.parse_args()
+    
     console = Console()
+    
+    if args.convert:
+        from_currency, to_currency, amount = args.convert
+        try:
+            amount = float(amount)
+        except ValueError:
+            parser.error(f"invalid amount: {amount!r}")
+        
+        # One-shot conversions skip the background rate updater entirely
+        converter = CurrencyConverter(background_updates=False)
+        result = converter.convert(
+            sys.intern(from_currency.upper()), sys.intern(to_currency.upper()), amount
+        )
+        
+        if result is None:
+            sys.exit(1)
+        console.print(f"{result:,.2f}")
+        # Keep stdout to the bare result so scripts can still parse it
+        Console(stderr=True).print(
+            "[yellow]Note: converted with built-in default rates; "
+            "live rates are only fetched in interactive mode.[/yellow]"
+        )
+        return
+    
     console.print("[bold blue]💱 Welcome to Live Currency Converter 💱[/bold blue]")
     
     converter = CurrencyConverter()
@@ -262,8 +558,8 @@ def main():
     except KeyboardInterrupt:
         console.print("\n[red]Operation cancelled.[/red]")
     finally:
-        # Ensure the update thread is stopped
-        converter.stop_update_thread.set()
+        # Ensure the rate updater is stopped
+        converter.stop_updates()
         console.print("[green]Thank you for using Currency Converter![/green]")
 
 if __name__ == "__main__":